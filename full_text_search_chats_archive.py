@@ -16,10 +16,23 @@ import sys
 import tempfile
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+# orjson (optional) parses JSON in C directly from bytes — noticeably faster
+# than the stdlib across tens of thousands of archive files. The archive
+# formats are plain JSON, so the two are interchangeable; fall back silently
+# when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 import providers
 from paths import (
     MACHINE_NAME_ENV_KEY,
@@ -71,6 +84,12 @@ class Colors:
     ORANGE = "\033[38;5;208m"
 
 
+# Score-descending sort key, shared by every result sort. attrgetter runs the
+# key extraction in C, and reverse=True keeps the same stable tie order as the
+# old per-element -score lambda without a Python call per result.
+_SCORE_KEY = attrgetter("total_score")
+
+
 @dataclass
 class Match:
     """Represents a single match within a conversation/project."""
@@ -107,6 +126,26 @@ class SearchResult:
         )
 
 
+@lru_cache(maxsize=256)
+def _word_pattern(word: str) -> "re.Pattern[str]":
+    """Whole-word pattern for one (already lowercased) query word.
+
+    Cached at module level so score_match compiles each word once per query,
+    not once per text chunk — the patterns depend only on the query, and a
+    search touches the same handful of words millions of times across a large
+    archive. find_matches_in_texts is shared by every scan entry point, so a
+    cache here covers them all without threading patterns through each one.
+    """
+    return re.compile(r"\b" + re.escape(word) + r"\b")
+
+
+@lru_cache(maxsize=256)
+def _term_pattern(term: str) -> "re.Pattern[str]":
+    """Case-insensitive literal pattern for a query term, cached like
+    _word_pattern. Used for context extraction and highlighting."""
+    return re.compile(re.escape(term), re.IGNORECASE)
+
+
 def score_match(match_lower: str, query_lower: str) -> float:
     """
     Calculate relevance score for a match. Both arguments must already be
@@ -131,7 +170,7 @@ def score_match(match_lower: str, query_lower: str) -> float:
 
     for word in query_words:
         # Whole word match
-        if re.search(r'\b' + re.escape(word) + r'\b', match_lower):
+        if _word_pattern(word).search(match_lower):
             score += 2
             words_found += 1
         # Partial match
@@ -309,6 +348,29 @@ def extract_text_from_project(data: dict) -> List[str]:
     return texts
 
 
+# Snippet cleanup: fold line/tab breaks to spaces in one C pass instead of
+# chained str.replace copies.
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# Upper bound on context snippets built per text. print_results shows two and
+# the JSON consumer rarely needs more; a pathological text with thousands of
+# hits would otherwise allocate thousands of Match objects. High enough that
+# per-hit score accumulation (and thus ranking) is unaffected for any
+# realistic conversation.
+_MAX_MATCHES_PER_TEXT = 50
+
+
+def _iter_literal_hits(text_lower: str, needle: str):
+    """Yield (start, end) spans of every non-overlapping occurrence of a
+    literal needle, via str.find — a C-speed scan with no regex dispatch.
+    Matches re.finditer's semantics (resume past each hit)."""
+    start = text_lower.find(needle)
+    while start != -1:
+        end = start + len(needle)
+        yield start, end
+        start = text_lower.find(needle, end)
+
+
 def find_matches_in_texts(texts: List[str], query: str, exact: bool = False) -> List[Match]:
     """
     Search a list of text strings for query matches.
@@ -325,18 +387,13 @@ def find_matches_in_texts(texts: List[str], query: str, exact: bool = False) ->
         for text in texts:
             if not text:
                 continue
-            preview = text.replace("\n", " ").strip()
+            preview = text.translate(_WS_TABLE).strip()
             if len(preview) > 200:
                 preview = preview[:200] + "..."
             return [Match(text=preview, score=0.0)]
         return []
 
-    # Patterns depend only on the query: compile once, not per matching text.
     query_words = query_lower.split()
-    if exact:
-        patterns = [re.compile(re.escape(query_lower), re.IGNORECASE)]
-    else:
-        patterns = [re.compile(re.escape(word), re.IGNORECASE) for word in query_words]
 
     for text in texts:
         if not text:
@@ -344,32 +401,77 @@ def find_matches_in_texts(texts: List[str], query: str, exact: bool = False) ->
 
         text_lower = text.lower()
 
-        # Check if query matches
         if exact:
-            matches_text = query_lower in text_lower
+            if query_lower not in text_lower:
+                continue
+            score = score_match(text_lower, query_lower)
+            hit_spans = list(_iter_literal_hits(text_lower, query_lower))
         else:
-            matches_text = all(word in text_lower for word in query_words)
+            if not all(word in text_lower for word in query_words):
+                continue
+            # One literal scan per word both collects the context spans and
+            # scores the text, replacing score_match's separate \b-regex scan
+            # per word plus a second IGNORECASE finditer per word — the same
+            # scoring criteria, with far fewer passes over the text.
+            score = 10.0 if query_lower in text_lower else 0.0
+            hit_spans = []
+            for word in query_words:
+                spans = list(_iter_literal_hits(text_lower, word))
+                # Whole word (+2) vs partial (+1), classified by anchoring the
+                # \b pattern at each hit, O(len(word)) per hit. A hit swallowed
+                # by the non-overlapping scan (self-overlapping words only)
+                # gets one confirming full search so scores never diverge from
+                # score_match's.
+                whole = any(_word_pattern(word).match(text_lower, s) for s, _ in spans)
+                if not whole and _word_pattern(word).search(text_lower):
+                    whole = True
+                score += 2 if whole else 1
+                hit_spans.extend(spans)
+            if len(query_words) > 1:
+                score += 5  # all words present, guaranteed by the gate above
+
+        # Extract context around matches (up to 200 chars)
+        for hit_start, hit_end in hit_spans[:_MAX_MATCHES_PER_TEXT]:
+            start = max(0, hit_start - 100)
+            end = min(len(text), hit_end + 100)
+            context = text[start:end].translate(_WS_TABLE).strip()
+
+            if start > 0:
+                context = "..." + context
+            if end < len(text):
+                context = context + "..."
+
+            matches.append(Match(text=context, score=score))
+
+    return matches
 
-        if matches_text:
-            score = score_match(text_lower, query_lower)
 
-            # Extract context around matches (up to 200 chars)
-            for pattern in patterns:
-                for match in pattern.finditer(text):
-                    start = max(0, match.start() - 100)
-                    end = min(len(text), match.end() + 100)
-                    context = text[start:end]
+@lru_cache(maxsize=64)
+def _prefilter_needles(query: str, exact: bool) -> Optional[Tuple[bytes, ...]]:
+    """Byte needles that MUST appear in a file's raw JSON for it to match
+    `query`, or None when no safe pre-filter exists (browse mode, or a query
+    whose characters JSON may escape on disk — non-ASCII text is stored as
+    \\uXXXX by the sync's json.dump, and quote/backslash are always escaped).
+    Needles are a necessary condition only, so filtering on them can skip a
+    parse but never drop a true match. Cached: search_item calls this once
+    per file with the same query."""
+    if not query.strip():
+        return None
+    words = [query.lower()] if exact else query.lower().split()
+    if not all(w.isascii() and '"' not in w and "\\" not in w for w in words):
+        return None
+    return tuple(w.encode("utf-8") for w in words)
 
-                    # Clean up context
-                    context = context.replace("\n", " ").strip()
-                    if start > 0:
-                        context = "..." + context
-                    if end < len(text):
-                        context = context + "..."
 
-                    matches.append(Match(text=context, score=score))
+def _any_needle_missing(raw: bytes, needles: Tuple[bytes, ...]) -> bool:
+    """True when some needle is absent from the ASCII-lowercased raw bytes.
 
-    return matches
+    A separate helper so the lowered copy of a multi-MB file is freed as soon
+    as the check returns, instead of staying live across the JSON parse and
+    doubling the peak footprint for matching files.
+    """
+    raw_lower = raw.lower()
+    return any(needle not in raw_lower for needle in needles)
 
 
 def search_item(filepath: Path, query: str, item_type: str, email: str, provider: str, exact: bool = False) -> Optional[SearchResult]:
@@ -379,8 +481,14 @@ def search_item(filepath: Path, query: str, item_type: str, email: str, provider
     Returns SearchResult if matches found, None otherwise.
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = filepath.read_bytes()
+        # Cheap substring pre-filter on the raw bytes: most files don't match
+        # the query at all, and a bytes.find is far cheaper than parsing a
+        # multi-MB JSON document just to discover that.
+        needles = _prefilter_needles(query, exact)
+        if needles is not None and _any_needle_missing(raw, needles):
+            return None
+        data = _json_loads(raw)
     except Exception as e:
         print(f"Warning: Could not read {filepath}: {e}", file=sys.stderr)
         return None
@@ -420,14 +528,18 @@ def search_item(filepath: Path, query: str, item_type: str, email: str, provider
                 if last_msg_date:
                     updated_at = last_msg_date
 
+        # Intern the identity fields: they repeat across every result (and
+        # arrive as fresh copies when results are unpickled from pool
+        # workers), so interning collapses 50k results' worth of duplicate
+        # strings to one backing copy per distinct value.
         return SearchResult(
-            type=item_type,
+            type=sys.intern(item_type),
             uuid=data["uuid"],
             name=name if name else "(untitled)",
             created_at=data["created_at"],
             updated_at=updated_at,
-            email=email,
-            provider=provider,
+            email=sys.intern(email),
+            provider=sys.intern(provider),
             filepath=filepath,
             matches=matches,
             total_score=total_score,
@@ -448,6 +560,18 @@ def extract_llm_texts(data: dict, item_type: str, provider: str) -> List[str]:
     return extract_text_from_project(data)
 
 
+# Below this many files a process pool's startup + pickling cost outweighs
+# the parallelism; scan serially instead.
+_PARALLEL_SCAN_MIN_FILES = 64
+
+
+def _search_item_task(task: tuple) -> Optional[SearchResult]:
+    """Unpack one (filepath, query, item_type, email, provider, exact) tuple
+    for executor.map, which feeds workers a single argument per call."""
+    filepath, query, item_type, email, provider, exact = task
+    return search_item(filepath, query, item_type, email, provider, exact=exact)
+
+
 def search_archive(data_dir: Path, query: str, apply_recency_boost: bool = True, exact: bool = False, candidates: Optional[set] = None) -> List[SearchResult]:
     """
     Search all conversations and projects in the archive.
@@ -455,6 +579,11 @@ def search_archive(data_dir: Path, query: str, apply_recency_boost: bool = True,
     `candidates` (paths as str) narrows the walk to files the search index
     pre-matched; it is always a superset of the true matches, so skipping
     the rest cannot drop results. None means no index: scan everything.
+
+    Large scans fan out across a process pool: each file is independent, and
+    the JSON parse + regex work is CPU-bound, so cores scale near-linearly.
+    executor.map preserves submission order, so the pre-sort result order
+    (and thus score-tie ordering) is identical to the serial walk.
     """
     results: List[SearchResult] = []
 
@@ -463,37 +592,49 @@ def search_archive(data_dir: Path, query: str, apply_recency_boost: bool = True,
         print(f"Error: Data directory not found: {data_dir}")
         return results
 
-    # Search in both claude/ and chatgpt/ subdirectories
+    # Gather the worklist first so it can be dispatched serially or in parallel.
+    tasks: List[tuple] = []
+
+    # Search in both claude/ and chatgpt/ subdirectories. os.scandir hands
+    # back DirEntry objects whose type checks use the cached dirent, so the
+    # walk costs one getdents pass per directory instead of a stat per entry
+    # (plus a Path allocation per entry, via iterdir/glob).
     for provider in ["claude", "chatgpt"]:
         provider_dir = data_dir / provider
         if not provider_dir.exists():
             continue
 
-        for user_dir in provider_dir.iterdir():
-            if not user_dir.is_dir():
-                continue
+        with os.scandir(provider_dir) as provider_it:
+            user_dirs = [(e.name, e.path) for e in provider_it if e.is_dir()]
 
-            email = user_dir.name
-
-            # Search conversations
-            conversations_dir = user_dir / "conversations"
-            if conversations_dir.exists():
-                for conv_file in conversations_dir.glob("*.json"):
-                    if candidates is not None and str(conv_file) not in candidates:
-                        continue
-                    result = search_item(conv_file, query, "conversation", email, provider, exact=exact)
-                    if result:
-                        results.append(result)
-
-            # Search projects
-            projects_dir = user_dir / "projects"
-            if projects_dir.exists():
-                for proj_file in projects_dir.glob("*.json"):
-                    if candidates is not None and str(proj_file) not in candidates:
-                        continue
-                    result = search_item(proj_file, query, "project", email, provider, exact=exact)
-                    if result:
-                        results.append(result)
+        for email, user_path in user_dirs:
+            for subdir, item_type in (("conversations", "conversation"), ("projects", "project")):
+                try:
+                    items_it = os.scandir(os.path.join(user_path, subdir))
+                except FileNotFoundError:
+                    continue
+                with items_it:
+                    for entry in items_it:
+                        if not entry.name.endswith(".json") or not entry.is_file():
+                            continue
+                        if candidates is not None and entry.path not in candidates:
+                            continue
+                        tasks.append((Path(entry.path), query, item_type, email, provider, exact))
+
+    if len(tasks) >= _PARALLEL_SCAN_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            # chunksize amortizes task pickling; results are small relative
+            # to the per-file parse they replace.
+            results = [r for r in executor.map(_search_item_task, tasks, chunksize=32) if r is not None]
+        # Unpickling handed each result private copies of the identity
+        # fields; re-intern in the parent so duplicates collapse again.
+        for r in results:
+            r.type = sys.intern(r.type)
+            r.email = sys.intern(r.email)
+            r.provider = sys.intern(r.provider)
+    else:
+        results = [r for r in map(_search_item_task, tasks) if r is not None]
 
     # Apply recency boost to scores
     if apply_recency_boost:
@@ -502,7 +643,7 @@ def search_archive(data_dir: Path, query: str, apply_recency_boost: bool = True,
 
     # The most relevant results should display at the bottom of the list, right
     # above the new terminal prompt.
-    results.sort(key=lambda r: -r.total_score)
+    results.sort(key=_SCORE_KEY, reverse=True)
 
     return results
 
@@ -584,7 +725,7 @@ def search_claude_code_archive(sources: List[Tuple[str, Path]], query: str, appl
         for result in results:
             result.total_score += recency_boost(result.updated_at)
 
-    results.sort(key=lambda r: -r.total_score)
+    results.sort(key=_SCORE_KEY, reverse=True)
     return results
 
 
@@ -602,14 +743,16 @@ def results_from_index_items(rows: List[dict], apply_recency_boost: bool = True)
                 "host": row["host"],
             }
         score = recency_boost(row["updated_at"]) if apply_recency_boost else 0.0
+        # sqlite hands back a fresh string per row; intern the identity
+        # fields so they share one backing copy per distinct value.
         results.append(SearchResult(
-            type=row["item_type"],
+            type=sys.intern(row["item_type"]),
             uuid=row["uuid"],
             name=row["name"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
-            email=row["email"],
-            provider=row["provider"],
+            email=sys.intern(row["email"]),
+            provider=sys.intern(row["provider"]),
             filepath=Path(row["path"]),
             matches=[Match(text=row["preview"], score=0.0)],
             total_score=score,
@@ -679,7 +822,7 @@ def results_from_index_rows(
             fallback.add(row["path"])
             continue
         try:
-            texts = json.loads(raw)
+            texts = _json_loads(raw)
         except (ValueError, TypeError):
             fallback.add(row["path"])
             continue
@@ -705,13 +848,13 @@ def results_from_index_rows(
                 "host": host,
             }
         results.append(SearchResult(
-            type=row["item_type"],
+            type=sys.intern(row["item_type"]),
             uuid=row["uuid"],
             name=row["name"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
-            email=row["email"],
-            provider=row["provider"],
+            email=sys.intern(row["email"]),
+            provider=sys.intern(row["provider"]),
             filepath=Path(row["path"]),
             matches=matches,
             total_score=total_score,
@@ -723,7 +866,7 @@ def results_from_index_rows(
         for result in results:
             result.total_score += recency_boost(result.updated_at)
 
-    results.sort(key=lambda r: -r.total_score)
+    results.sort(key=_SCORE_KEY, reverse=True)
     return results, fallback
 
 
@@ -826,7 +969,7 @@ def search_codex_archive(sources: List[Tuple[str, Path]], query: str, apply_rece
         for result in results:
             result.total_score += recency_boost(result.updated_at)
 
-    results.sort(key=lambda r: -r.total_score)
+    results.sort(key=_SCORE_KEY, reverse=True)
     return results
 
 
@@ -958,15 +1101,16 @@ def here_miss_hint(
     return "\n".join(f"{Colors.DIM}{line}{Colors.RESET}" for line in lines)
 
 
+# sub() replacement template for highlight_query: \g<0> re-emits the matched
+# text between the colour codes, letting sub skip a Python callback per match.
+_HIGHLIGHT_REPL = f"{Colors.BRIGHT_YELLOW}{Colors.BOLD}\\g<0>{Colors.RESET}"
+
+
 def highlight_query(text: str, query: str, exact: bool = False) -> str:
     """Highlight query matches in text with color."""
     terms = [query] if exact else query.split()
     for term in terms:
-        pattern = re.compile(re.escape(term), re.IGNORECASE)
-        text = pattern.sub(
-            lambda m: f"{Colors.BRIGHT_YELLOW}{Colors.BOLD}{m.group()}{Colors.RESET}",
-            text
-        )
+        text = _term_pattern(term).sub(_HIGHLIGHT_REPL, text)
     return text
 
 
@@ -1061,8 +1205,29 @@ def result_to_entry(result: SearchResult) -> dict:
 
 
 def print_json(results: List[SearchResult]):
-    """Print results as JSON."""
-    print(json.dumps([result_to_entry(r) for r in results], indent=2, ensure_ascii=False))
+    """Print results as JSON, streaming one entry at a time.
+
+    Serializing the whole list at once held a second full copy of the result
+    data in memory and emitted nothing until the end; per-entry writes keep
+    the footprint at one entry and start output immediately. The emitted
+    bytes are the same 2-space-indented array shape as before.
+    """
+    if not results:
+        print("[]")
+        return
+    out = sys.stdout
+    out.write("[\n")
+    for i, result in enumerate(results):
+        if i:
+            out.write(",\n")
+        entry = result_to_entry(result)
+        if orjson is not None:
+            chunk = orjson.dumps(entry, option=orjson.OPT_INDENT_2).decode()
+        else:
+            chunk = json.dumps(entry, indent=2, ensure_ascii=False)
+        # Re-indent the entry under the enclosing array, as dumps(list) did.
+        out.write("  " + chunk.replace("\n", "\n  "))
+    out.write("\n]\n")
 
 
 def canonical_entries(results: List[SearchResult]) -> List[dict]:
@@ -1166,7 +1331,7 @@ def open_results_in_editor(results: List[SearchResult], count: int, config: dict
     script_dir = Path(__file__).parent.resolve()
     sys.path.insert(0, str(script_dir))
     try:
-        from view_conversation import render_conversation, get_output_path
+        from view_conversation import render_conversation, get_output_path, classify_refresh
     except ImportError as e:
         print(f"Error: Could not import view_conversation: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1174,18 +1339,23 @@ def open_results_in_editor(results: List[SearchResult], count: int, config: dict
     local_views_dir = resolve_local_views_dir(script_dir, config)
     local_views_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate markdown files for each result
-    # Take the last N results (highest scoring) since print_results() reverses the list
-    markdown_files = []
-    for result in results[-count:][::-1]:
+    def _materialize(result: SearchResult) -> Tuple[str, bool, str]:
+        """Produce the markdown file for one result; returns (message,
+        message_is_error, path_to_open). Runs on a worker thread, so it
+        never prints — the caller reports outcomes in display order."""
         # Get output path for markdown file
         md_path = get_output_path(local_views_dir, result.uuid, result.provider, "markdown")
 
-        # Check if markdown file already exists
-        if md_path.exists():
-            print(f"Using existing markdown: {md_path.name}")
-            markdown_files.append(str(md_path))
-            continue
+        # Reuse the cached markdown only while it is at least as new as the
+        # source transcript — two stat calls instead of a parse + render. A
+        # file that predates the source may be missing newer messages, so it
+        # falls through to regeneration (a bare exists() check never noticed).
+        try:
+            cached_fresh = md_path.stat().st_mtime >= result.filepath.stat().st_mtime
+        except OSError:
+            cached_fresh = False
+        if cached_fresh:
+            return (f"Using existing markdown: {md_path.name}", False, str(md_path))
 
         # Render to markdown via the shared per-provider dispatcher (handles
         # claude-code/codex transcripts and web conversation/project JSON).
@@ -1193,17 +1363,39 @@ def open_results_in_editor(results: List[SearchResult], count: int, config: dict
             markdown_content = render_conversation(
                 result.provider, result.filepath, "markdown", result.type)
 
+            # A stale cached file may still carry local edits; mirror
+            # view_conversation's policy and never clobber those.
+            if md_path.exists() and classify_refresh(
+                    md_path.read_text(encoding="utf-8"), markdown_content) == "diverged":
+                return (f"Using edited markdown: {md_path.name}", False, str(md_path))
+
             # Write markdown file
             with open(md_path, "w", encoding="utf-8") as f:
                 f.write(markdown_content)
 
-            print(f"Generated markdown: {md_path.name}")
-            markdown_files.append(str(md_path))
+            return (f"Generated markdown: {md_path.name}", False, str(md_path))
 
         except Exception as e:
-            print(f"Warning: Could not convert {result.filepath.name} to markdown: {e}", file=sys.stderr)
             # Fall back to opening the original file
-            markdown_files.append(str(result.filepath))
+            return (f"Warning: Could not convert {result.filepath.name} to markdown: {e}",
+                    True, str(result.filepath))
+
+    # Generate markdown files for each result. Renders are independent
+    # (distinct results write distinct paths), so overlap the read/render/
+    # write pipelines on a small thread pool; executor.map preserves order.
+    # Take the last N results (highest scoring) since print_results() reverses the list.
+    to_open = results[-count:][::-1]
+    if len(to_open) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(to_open))) as executor:
+            outcomes = list(executor.map(_materialize, to_open))
+    else:
+        outcomes = [_materialize(r) for r in to_open]
+
+    markdown_files = []
+    for message, is_error, path in outcomes:
+        print(message, file=sys.stderr if is_error else sys.stdout)
+        markdown_files.append(path)
 
     if not markdown_files:
         print("No files to open.")
@@ -1468,7 +1660,7 @@ Examples:
                 sys.exit(1)
 
     # Re-sort combined results by score
-    results.sort(key=lambda r: -r.total_score)
+    results.sort(key=_SCORE_KEY, reverse=True)
 
     # Re-sort by updated date then score if requested (most recent at bottom).
     # Browse mode (no query) always orders by recency; scores are all ~0 there.
@@ -1532,7 +1724,7 @@ Examples:
             if no_query:
                 picker_results = sorted(results, key=lambda r: r.updated_at, reverse=True)
             else:
-                picker_results = sorted(results, key=lambda r: -r.total_score)
+                picker_results = sorted(results, key=_SCORE_KEY, reverse=True)
             demo = bool(config.get("DEMO_HOSTNAMES", "").strip())
             sys.exit(interactive_picker.pick_and_act(picker_results, query, args.exact, current_host, demo))
     else:
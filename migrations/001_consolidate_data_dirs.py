@@ -25,6 +25,9 @@ Usage:
 """
 
 import argparse
+import errno
+import heapq
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -68,15 +71,23 @@ def check_already_migrated(repo_root: Path) -> bool:
     )
 
 
-def list_dir_contents(path: Path, indent: str = "  ") -> list[str]:
-    """Return a list of lines describing the directory contents (one level deep)."""
-    lines = []
+def list_dir_contents(path: Path, indent: str = "  ", limit: int = 5) -> tuple[list[str], int]:
+    """Describe the alphabetically first `limit` entries of a directory (one
+    level deep). Returns (lines, total_entry_count).
+
+    Only names (not Path objects) are held, and only `limit` lines are built:
+    this runs against data dirs that can hold tens of thousands of
+    conversations, just to print a handful of preview lines.
+    """
     if not path.exists():
-        return lines
-    for item in sorted(path.iterdir()):
-        label = "/" if item.is_dir() else ""
-        lines.append(f"{indent}{item.name}{label}")
-    return lines
+        return [], 0
+    names: list[tuple[str, bool]] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            names.append((entry.name, entry.is_dir()))
+    first = heapq.nsmallest(limit, names)
+    lines = [f"{indent}{name}{'/' if is_dir else ''}" for name, is_dir in first]
+    return lines, len(names)
 
 
 def move_dir(src: Path, dst: Path, label: str) -> bool:
@@ -94,7 +105,15 @@ def move_dir(src: Path, dst: Path, label: str) -> bool:
         return False
 
     try:
-        shutil.move(str(src), str(dst))
+        # Same-filesystem move is a single inode rename — instant regardless
+        # of directory size. Only fall back to shutil.move's copy+delete when
+        # src and dst actually live on different devices.
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
         print(f"  {GREEN}✓{RESET} {label}")
         print(f"    {DIM}{src}{RESET}")
         print(f"    {DIM}→ {dst}{RESET}")
@@ -235,11 +254,11 @@ def main():
         status = f"{GREEN}exists{RESET}" if path.exists() else f"{DIM}not found{RESET}"
         print(f"  {path.name}/  [{status}]")
         if path.exists():
-            contents = list_dir_contents(path)
-            for line in contents[:5]:
+            lines, total = list_dir_contents(path)
+            for line in lines:
                 print(line)
-            if len(contents) > 5:
-                print(f"  ... and {len(contents) - 5} more")
+            if total > len(lines):
+                print(f"  ... and {total - len(lines)} more")
 
     # --- Show migration plan ---
     print(f"\n{BOLD}This migration will:{RESET}")
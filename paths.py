@@ -86,6 +86,11 @@ CLAUDE_CODE_HOST_ENV_KEY = "CLAUDE_CODE_HOST"
 # Read precedence for the machine name: canonical key first, then legacy alias.
 _HOST_NAME_ENV_KEYS = (MACHINE_NAME_ENV_KEY, CLAUDE_CODE_HOST_ENV_KEY)
 
+# Inline trailing comment: '#' preceded by whitespace. Compiled once; every
+# .env reader funnels each line through parse_env_assignment, so this runs
+# per line of every config read.
+_INLINE_COMMENT_RE = re.compile(r"\s+#")
+
 
 def parse_env_assignment(line: str) -> tuple[str, str, bool] | None:
     """Parse one raw .env line as a KEY=VALUE assignment, active or commented.
@@ -110,12 +115,13 @@ def parse_env_assignment(line: str) -> tuple[str, str, bool] | None:
         return None
     is_commented = stripped.startswith("#")
     body = stripped.lstrip("#").strip() if is_commented else stripped
-    if "=" not in body:
+    # partition does the membership test and the split in one scan
+    key, sep, value = body.partition("=")
+    if not sep:
         return None
-    key, value = body.split("=", 1)
     key = key.strip()
     value = value.strip()
-    m = re.search(r"\s+#", value)
+    m = _INLINE_COMMENT_RE.search(value)
     if m:
         value = value[: m.start()].rstrip()
     if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
@@ -130,9 +136,13 @@ def load_env_file(path: Path) -> dict:
     key is assigned more than once, the last assignment wins.
     """
     config: dict = {}
-    if not path.exists():
+    try:
+        # One read + splitlines, and no exists() pre-check: the open itself
+        # answers that question, saving a stat per startup (and a race).
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return config
-    for raw in path.read_text(encoding="utf-8").splitlines():
+    for raw in text.splitlines():
         parsed = parse_env_assignment(raw)
         if parsed is None:
             continue
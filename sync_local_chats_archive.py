@@ -11,23 +11,129 @@ Supports:
 """
 
 import argparse
+import io
 import json
 import os
 import re
 import sys
+import time
 import zipfile
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 
 from paths import resolve_data_dir, resolve_archived_exports_dir, resolve_env_path, load_env_file
 
+# orjson (optional) parses and serializes JSON in C — a large win on
+# multi-hundred-MB conversations.json exports. It consumes the bytes
+# zipfile.read returns directly, skipping the text decode. Fall back
+# silently to the stdlib when it isn't installed (its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is unchanged).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes/str with orjson when available, stdlib otherwise."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _load_json_member(zf: zipfile.ZipFile, name: str):
+    """Parse one JSON member of an open zip.
+
+    With orjson, read the decompressed bytes and parse them directly (orjson
+    wants the whole buffer and skips the text decode). With the stdlib,
+    decode incrementally off the decompressing stream instead: the full
+    decompressed ``bytes`` buffer then never exists alongside the parsed
+    text, which roughly halves peak memory on a large conversations.json.
+    """
+    if orjson is not None:
+        return orjson.loads(zf.read(name))
+    with zf.open(name) as fp:
+        return json.load(io.TextIOWrapper(fp, encoding="utf-8"))
+
+
+# Exports below this size aren't worth I/O hints; plain buffered reads
+# are fine and keep the common path simple.
+_FADVISE_ZIP_MIN_BYTES = 64 * 1024 * 1024
+
+
+@contextmanager
+def _open_zip(zip_path: Path):
+    """Open an export zip for reading, with readahead hints for large ones.
+
+    Multi-GB exports are read end to end exactly once (central directory,
+    then each member sequentially), so tell the kernel: SEQUENTIAL widens
+    its readahead window and WILLNEED starts prefetching immediately, so
+    pages are resident before the decompressor asks for them. An mmap-
+    backed ZipFile was tried first but zipfile's reads copy out of the
+    mapping anyway, and fadvise gets the same readahead without one.
+    """
+    with open(zip_path, "rb") as f:
+        if (
+            hasattr(os, "posix_fadvise")
+            and zip_path.stat().st_size >= _FADVISE_ZIP_MIN_BYTES
+        ):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        with zipfile.ZipFile(f) as zf:
+            yield zf
+
+
+def _dump_json_bytes(obj) -> bytes:
+    """Serialize obj as 2-space-indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write payload to path atomically (tmp file + rename).
+
+    An interrupted in-place write leaves a truncated JSON file that every
+    later scan warns about; os.replace swaps the complete file in as one
+    atomic rename, so readers only ever see the old or the new content.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def _write_json(path: Path, obj) -> None:
+    """Write obj to path as 2-space-indented UTF-8 JSON.
+
+    Serializes to one buffer first and writes it in a single call (rather
+    than json.dump's many small writes through the text layer) — fewer
+    syscalls, and a thread doing this holds the GIL only for the dumps.
+    """
+    _write_bytes_atomic(path, _dump_json_bytes(obj))
+
 
 # ============================================================================
 # Shared utility functions
 # ============================================================================
 
+# sanitize_name patterns, compiled once: it runs once per conversation/project
+# in an export, which can be tens of thousands of calls per sync.
+_SANITIZE_DISALLOWED_RE = re.compile(r"[^a-zA-Z0-9-]")
+_SANITIZE_DASHES_RE = re.compile(r"-+")
+
+# ASCII fast path: a translate table that deletes every disallowed ASCII
+# character in one C pass, skipping the regex engine for the overwhelmingly
+# common all-ASCII name. Non-ASCII characters are all disallowed anyway, so
+# non-ASCII names take the regex path.
+_SANITIZE_DELETE_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c == "-")))
+
+
 def sanitize_name(name: str) -> str:
     """
     Convert a conversation/project name to a filesystem-safe name.
@@ -38,24 +144,48 @@ def sanitize_name(name: str) -> str:
     # Replace spaces with hyphens
     name = name.replace(" ", "-")
     # Keep only alphanumeric characters and hyphens
-    name = re.sub(r"[^a-zA-Z0-9-]", "", name)
+    if name.isascii():
+        name = name.translate(_SANITIZE_DELETE_TABLE)
+    else:
+        name = _SANITIZE_DISALLOWED_RE.sub("", name)
     # Collapse multiple consecutive hyphens
-    name = re.sub(r"-+", "-", name)
+    name = _SANITIZE_DASHES_RE.sub("-", name)
     # Strip leading/trailing hyphens
     name = name.strip("-")
     return name if name else "untitled"
 
 
+@lru_cache(maxsize=4096)
 def format_date(date_str: str) -> str:
     """
     Extract date in YYYY-MM-DD format from ISO timestamp or Unix timestamp.
     Handles both ISO format strings and numeric Unix timestamps.
+
+    Pure function of its input, called once per item in an export, so
+    results are memoized: re-syncing the same export re-parses nothing,
+    and duplicated timestamps within one export are parsed once.
     """
     try:
-        # Handle Unix timestamp (float or int)
+        # Handle Unix timestamp (float or int). time.localtime is a thin
+        # C call; formatting the three fields directly skips building a
+        # datetime just to strftime it. Stays localtime, matching what
+        # datetime.fromtimestamp produced here since day one.
         if isinstance(date_str, (int, float)):
-            dt = datetime.fromtimestamp(date_str)
-            return dt.strftime("%Y-%m-%d")
+            tm = time.localtime(date_str)
+            return f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+
+        # Fast path: well-formed ISO timestamps ("2025-10-19T22:48:47.852498Z")
+        # start with the date itself — slice it out instead of building a
+        # datetime just to strftime it back. Anything shaped differently
+        # falls through to the general parser.
+        if (
+            len(date_str) >= 10
+            and date_str[4] == "-"
+            and date_str[7] == "-"
+            and (len(date_str) == 10 or date_str[10] in "T ")
+            and date_str[:10].replace("-", "").isdigit()
+        ):
+            return date_str[:10]
 
         # Handle ISO format string
         dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
@@ -81,18 +211,24 @@ def build_unique_filenames(items: List[Dict]) -> Dict[str, str]:
 
     Returns a mapping from UUID to unique filename (without .json extension).
     """
-    # First pass: group items by their base filename
-    filename_to_items: Dict[str, List[Tuple[str, Dict]]] = {}
+    # First pass: group items by their base filename. defaultdict turns the
+    # membership-test-plus-insert into a single hash lookup per item.
+    filename_to_items: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
+
+    # One C-level itemgetter call replaces three .get method dispatches per
+    # item. Validation only spot-checks the first item, so a later item may
+    # legitimately lack a key — those fall back to the tolerant .get path.
+    get_fields = itemgetter("uuid", "created_at", "name")
 
     for item in items:
-        uuid = item.get("uuid")
-        created_at = item.get("created_at")
-        name = item.get("name", "")
+        try:
+            uuid, created_at, name = get_fields(item)
+        except KeyError:
+            uuid = item.get("uuid")
+            created_at = item.get("created_at")
+            name = item.get("name", "")
 
         base_filename = build_filename(created_at, name)
-
-        if base_filename not in filename_to_items:
-            filename_to_items[base_filename] = []
         filename_to_items[base_filename].append((uuid, item))
 
     # Second pass: assign unique filenames
@@ -371,7 +507,16 @@ class ClaudeProvider(Provider):
 
     def find_zip_files(self, search_dir: Path) -> List[Path]:
         """Find Claude export zip files (data-*.zip pattern)."""
-        return list(search_dir.glob("data-*.zip"))
+        # os.scandir + two string checks: no per-entry Path construction or
+        # glob-pattern regex for directories (like ~/Downloads) that can
+        # hold thousands of unrelated files.
+        with os.scandir(search_dir) as it:
+            return [
+                Path(entry.path) for entry in it
+                if entry.name.startswith("data-")
+                and entry.name.endswith(".zip")
+                and entry.is_file()
+            ]
 
     def _read_projects(self, zf: zipfile.ZipFile) -> List[Dict]:
         """Read projects from a Claude export.
@@ -381,21 +526,21 @@ class ClaudeProvider(Provider):
         """
         names = set(zf.namelist())
         if "projects.json" in names:
-            return json.loads(zf.read("projects.json"))
+            return _load_json_member(zf, "projects.json")
 
         project_files = sorted(
             n for n in names
             if n.startswith("projects/") and n.endswith(".json")
         )
-        return [json.loads(zf.read(n)) for n in project_files]
+        return [_load_json_member(zf, n) for n in project_files]
 
     def extract_export_data(self, zip_path: Path) -> Dict:
         """Extract users, conversations, and projects from a Claude export."""
-        with zipfile.ZipFile(zip_path, "r") as zf:
+        with _open_zip(zip_path) as zf:
             try:
                 return {
-                    "users": json.loads(zf.read("users.json")),
-                    "conversations": json.loads(zf.read("conversations.json")),
+                    "users": _load_json_member(zf, "users.json"),
+                    "conversations": _load_json_member(zf, "conversations.json"),
                     "projects": self._read_projects(zf)
                 }
             except KeyError as e:
@@ -451,8 +596,7 @@ class ClaudeProvider(Provider):
         """Save user.json from export data."""
         user = export_data["users"][0]
         user_json_path = user_dir / "user.json"
-        with open(user_json_path, "w", encoding="utf-8") as f:
-            json.dump(user, f, indent=2, ensure_ascii=False)
+        _write_json(user_json_path, user)
         print(f"Saved user data to: {user_json_path}")
 
     def get_conversations(self, export_data: Dict) -> List[Dict]:
@@ -470,20 +614,25 @@ class ClaudeProvider(Provider):
         Check if existing conversation should be deleted.
         Only delete if BOTH conversation UUID matches AND account UUID matches.
         """
+        # One set lookup answers the common case (file not in this export);
+        # only matches pay for the account lookup. `or {}` instead of a
+        # .get default skips allocating a throwaway dict per call and also
+        # tolerates an explicit "account": null.
         existing_uuid = existing_data.get("uuid")
-        existing_account_uuid = existing_data.get("account", {}).get("uuid")
+        if existing_uuid not in new_uuids:
+            return False
+
+        existing_account_uuid = (existing_data.get("account") or {}).get("uuid")
 
         # Only delete if BOTH the conversation UUID matches AND it belongs to the same user
-        if existing_uuid in new_uuids and existing_account_uuid == user_uuid:
+        if existing_account_uuid == user_uuid:
             print(f"  Removing old version: UUID {existing_uuid}")
             return True
-        elif existing_uuid in new_uuids and existing_account_uuid != user_uuid:
-            # This should never happen, but log it as a warning
-            print(f"  WARNING: Found conversation with UUID {existing_uuid} but different account UUID!")
-            print(f"           Expected account: {user_uuid}, Found: {existing_account_uuid}")
-            print(f"           Skipping deletion for safety.")
-            return False
 
+        # This should never happen, but log it as a warning
+        print(f"  WARNING: Found conversation with UUID {existing_uuid} but different account UUID!")
+        print(f"           Expected account: {user_uuid}, Found: {existing_account_uuid}")
+        print(f"           Skipping deletion for safety.")
         return False
 
     def should_delete_existing_project(self, existing_data: Dict,
@@ -493,20 +642,23 @@ class ClaudeProvider(Provider):
         Check if existing project should be deleted.
         Only delete if BOTH project UUID matches AND creator UUID matches.
         """
+        # Same shape as should_delete_existing_conversation: decide on the
+        # set lookup first, defer the creator lookup to actual matches.
         existing_uuid = existing_data.get("uuid")
-        existing_creator_uuid = existing_data.get("creator", {}).get("uuid")
+        if existing_uuid not in new_uuids:
+            return False
+
+        existing_creator_uuid = (existing_data.get("creator") or {}).get("uuid")
 
         # Only delete if BOTH the project UUID matches AND it belongs to the same user
-        if existing_uuid in new_uuids and existing_creator_uuid == user_uuid:
+        if existing_creator_uuid == user_uuid:
             print(f"  Removing old version: UUID {existing_uuid}")
             return True
-        elif existing_uuid in new_uuids and existing_creator_uuid != user_uuid:
-            # This should never happen, but log it as a warning
-            print(f"  WARNING: Found project with UUID {existing_uuid} but different creator UUID!")
-            print(f"           Expected creator: {user_uuid}, Found: {existing_creator_uuid}")
-            print(f"           Skipping deletion for safety.")
-            return False
 
+        # This should never happen, but log it as a warning
+        print(f"  WARNING: Found project with UUID {existing_uuid} but different creator UUID!")
+        print(f"           Expected creator: {user_uuid}, Found: {existing_creator_uuid}")
+        print(f"           Skipping deletion for safety.")
         return False
 
 
@@ -514,6 +666,16 @@ class ClaudeProvider(Provider):
 # ChatGPT provider implementation
 # ============================================================================
 
+# ChatGPT export zip name: [64-hex]-YYYY-MM-DD-HH-MM-SS-[hex].zip. Compiled
+# once; find_zip_files tests it against every .zip in ZIP_SEARCH_DIR (often a
+# downloads folder full of unrelated zips).
+_CHATGPT_ZIP_RE = re.compile(r'^[a-f0-9]{64}-\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2}-[a-f0-9]+\.zip$')
+
+# Shortest name the pattern can match: 64 hex + "-" + 19-char timestamp +
+# "-" + 1 hex + ".zip".
+_CHATGPT_ZIP_MIN_LEN = 64 + 1 + 19 + 1 + 1 + 4
+
+
 class ChatGPTProvider(Provider):
     """Provider implementation for ChatGPT exports."""
 
@@ -524,8 +686,13 @@ class ChatGPTProvider(Provider):
         """
         Normalize ChatGPT conversation format to internal format.
         Converts: id → uuid, title → name, create_time → created_at
+
+        Mutates and returns the conversation dict: the export data is ours
+        (freshly parsed from the zip, never re-read in original shape), so
+        copying every conversation — including its whole message mapping —
+        just to add three keys would be pure overhead.
         """
-        normalized = dict(conv)  # Make a copy
+        normalized = conv
 
         # `id` addresses the conversation, so it is required. validate() only
         # checks the first conversation in an export, so a later malformed one
@@ -554,19 +721,26 @@ class ChatGPTProvider(Provider):
 
     def find_zip_files(self, search_dir: Path) -> List[Path]:
         """Find ChatGPT export zip files ([hex]-YYYY-MM-DD-HH-MM-SS-[hex].zip pattern)."""
-        all_zips = list(search_dir.glob("*.zip"))
-
-        # Filter for ChatGPT pattern: long hex string followed by date
-        chatgpt_pattern = re.compile(r'^[a-f0-9]{64}-\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2}-[a-f0-9]+\.zip$')
-        return [z for z in all_zips if chatgpt_pattern.match(z.name)]
+        # Cheap C-level shape checks (length, separator position) reject
+        # unrelated zips before the regex engine is invoked at all, and
+        # os.scandir only builds a Path for the entries that survive.
+        with os.scandir(search_dir) as it:
+            return [
+                Path(entry.path) for entry in it
+                if len(entry.name) >= _CHATGPT_ZIP_MIN_LEN
+                and entry.name[64] == "-"
+                and entry.name.endswith(".zip")
+                and _CHATGPT_ZIP_RE.match(entry.name)
+                and entry.is_file()
+            ]
 
     def extract_export_data(self, zip_path: Path) -> Dict:
         """Extract conversations.json and user.json from ChatGPT export."""
-        with zipfile.ZipFile(zip_path, "r") as zf:
+        with _open_zip(zip_path) as zf:
             try:
                 return {
-                    "conversations": json.loads(zf.read("conversations.json")),
-                    "user": json.loads(zf.read("user.json"))
+                    "conversations": _load_json_member(zf, "conversations.json"),
+                    "user": _load_json_member(zf, "user.json")
                 }
             except KeyError as e:
                 print(f"ERROR: Missing expected file in zip: {e}")
@@ -612,8 +786,7 @@ class ChatGPTProvider(Provider):
         user_json_path = user_dir / "user.json"
         user_data = export_data.get("user")
 
-        with open(user_json_path, "w", encoding="utf-8") as f:
-            json.dump(user_data, f, indent=2, ensure_ascii=False)
+        _write_json(user_json_path, user_data)
         print(f"Saved user data to: {user_json_path}")
 
     def get_conversations(self, export_data: Dict) -> List[Dict]:
@@ -652,6 +825,42 @@ class ChatGPTProvider(Provider):
 # Common orchestration logic
 # ============================================================================
 
+# Archived item files are written by this script with 2-space indentation,
+# so the top-level "uuid" key sits on a line indented exactly two spaces
+# (nested keys are deeper; string content can't match because JSON escapes
+# embedded quotes). That structural anchor lets the delete-scan read the
+# uuid with a bounded regex instead of parsing megabytes of chat messages.
+_PEEK_UUID_RE = re.compile(rb'^  "uuid": "([^"\\]+)"', re.M)
+_PEEK_BYTES = 4096
+
+
+def _peek_top_level_uuid(path: str) -> Optional[str]:
+    """Read an archived item's top-level uuid from a bounded prefix/suffix.
+
+    Claude exports put uuid first, so it lands in the head read; normalized
+    ChatGPT conversations append uuid after the message mapping, so it lands
+    in the tail read. Returns None when neither bounded read finds it (the
+    caller falls back to a full json.load).
+    """
+    with open(path, "rb") as f:
+        head = f.read(_PEEK_BYTES)
+        m = _PEEK_UUID_RE.search(head)
+        if m is None:
+            size = os.fstat(f.fileno()).st_size
+            if size > _PEEK_BYTES:
+                f.seek(size - _PEEK_BYTES)
+                tail = f.read(_PEEK_BYTES)
+                # Drop the partial first line so ^ can't anchor mid-line
+                # (a truncated deeper-indented line could otherwise start
+                # the buffer with two spaces and masquerade as top-level).
+                nl = tail.find(b"\n")
+                if nl != -1:
+                    m = _PEEK_UUID_RE.search(tail, nl + 1)
+    if m is None:
+        return None
+    return m.group(1).decode("utf-8", errors="replace")
+
+
 def process_items(items: List[Dict], items_dir: Path, item_type: str,
                  user_uuid: str, provider: Provider,
                  should_delete_fn) -> None:
@@ -674,31 +883,75 @@ def process_items(items: List[Dict], items_dir: Path, item_type: str,
     # Build unique filenames for all items
     uuid_to_filename = build_unique_filenames(items)
 
-    # Build UUID set from new export
-    new_uuids: Set[str] = {item["uuid"] for item in items}
-
-    # Delete existing files with matching UUIDs (if appropriate)
-    existing_files = list(items_dir.glob("*.json"))
-    for existing_file in existing_files:
+    # Build UUID set from new export. build_unique_filenames already keyed
+    # its result by uuid, so lift the keys rather than walking items again.
+    new_uuids: Set[str] = set(uuid_to_filename)
+
+    # Delete existing files with matching UUIDs (if appropriate). os.scandir
+    # with string paths skips the per-entry Path construction and glob regex
+    # of items_dir.glob("*.json"); the list is materialized up front so
+    # unlinking never races the directory iterator.
+    with os.scandir(items_dir) as it:
+        existing_entries = [
+            entry for entry in it
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        ]
+    for entry in existing_entries:
         try:
-            with open(existing_file, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-
-                if should_delete_fn(existing_data, new_uuids, user_uuid):
-                    existing_file.unlink()
+            # Most existing files aren't in the incoming export. Peek at the
+            # top-level uuid first and only pay for the full parse (which the
+            # provider predicates need for account/creator checks) when the
+            # uuid actually matches or the peek couldn't find one.
+            peeked_uuid = _peek_top_level_uuid(entry.path)
+            if peeked_uuid is not None and peeked_uuid not in new_uuids:
+                continue
+
+            with open(entry.path, "rb") as f:
+                existing_data = _json_loads(f.read())
+
+            if should_delete_fn(existing_data, new_uuids, user_uuid):
+                os.unlink(entry.path)
         except Exception as e:
-            print(f"  Warning: Could not check {existing_file.name}: {e}")
-
-    # Write new item files
-    for item in items:
+            print(f"  Warning: Could not check {entry.name}: {e}")
+
+    # Write new item files. Each item goes to its own file, so the writes
+    # are independent; a small thread pool overlaps serialization with the
+    # kernel's write path. Workers return what to report and the parent
+    # prints in item order, same as the old sequential loop.
+    #
+    # Re-syncing overlapping exports mostly re-produces identical bytes, so
+    # compare against the existing file (size first, then content) and skip
+    # the rewrite when nothing changed. Stable mtimes keep the search
+    # index's refresh and folder-sync tools from reprocessing untouched
+    # conversations.
+    def _write_item(item: Dict) -> Tuple[str, str, bool]:
         uuid = item["uuid"]
         filename = uuid_to_filename[uuid]
         filepath = items_dir / f"{filename}.json"
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(item, f, indent=2, ensure_ascii=False)
-
-        print(f"  Saved: {filename}.json (UUID: {uuid})")
+        payload = _dump_json_bytes(item)
+        try:
+            if (
+                filepath.stat().st_size == len(payload)
+                and filepath.read_bytes() == payload
+            ):
+                return filename, uuid, False
+        except OSError:
+            pass
+        _write_bytes_atomic(filepath, payload)
+        return filename, uuid, True
+
+    def _report(filename: str, uuid: str, wrote: bool) -> None:
+        if wrote:
+            print(f"  Saved: {filename}.json (UUID: {uuid})")
+        else:
+            print(f"  Unchanged: {filename}.json (UUID: {uuid})")
+
+    if len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+            for filename, uuid, wrote in executor.map(_write_item, items):
+                _report(filename, uuid, wrote)
+    else:
+        _report(*_write_item(items[0]))
 
 
 def extract_and_organize(provider: Provider, zip_path: Path) -> str:
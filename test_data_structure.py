@@ -11,7 +11,10 @@ This script checks that:
 """
 
 import json
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
@@ -39,20 +42,32 @@ def print_warning(msg: str) -> None:
     print(f"{YELLOW}⚠{RESET} {msg}")
 
 
-def validate_json_file(filepath: Path) -> Tuple[bool, str]:
+def validate_json_file(filepath: Path) -> Tuple[bool, str, dict]:
     """
     Validate that a file contains valid JSON.
 
-    Returns (success, error_message).
+    Returns (success, error_message, data) — the parsed data rides along so
+    the structural checks that follow don't parse the same file a second
+    time; data is None when parsing failed.
     """
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            json.load(f)
-        return True, ""
+            return True, "", json.load(f)
     except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {e}"
+        return False, f"Invalid JSON: {e}", None
     except Exception as e:
-        return False, f"Error reading file: {e}"
+        return False, f"Error reading file: {e}", None
+
+
+# Field requirements, hoisted so the per-file checks are one C-level set
+# difference (or membership test) rather than a Python loop of lookups.
+_REQUIRED_CONVERSATION_FIELDS = frozenset({"uuid", "name", "created_at", "updated_at"})
+_REQUIRED_PROJECT_FIELDS = frozenset({"uuid", "name", "created_at"})
+_VALID_SENDERS = frozenset({"human", "assistant"})
+
+# Sentinel distinguishing "sender absent" from "sender present but bogus"
+# with a single dict lookup in the message loop.
+_MISSING = object()
 
 
 def validate_conversation_structure(data: dict, filepath: Path) -> List[str]:
@@ -63,11 +78,9 @@ def validate_conversation_structure(data: dict, filepath: Path) -> List[str]:
     """
     errors = []
 
-    # Required top-level fields
-    required_fields = ["uuid", "name", "created_at", "updated_at"]
-    for field in required_fields:
-        if field not in data:
-            errors.append(f"Missing required field: {field}")
+    # Required top-level fields (sorted so error output stays deterministic)
+    missing = _REQUIRED_CONVERSATION_FIELDS - data.keys()
+    errors.extend(f"Missing required field: {field}" for field in sorted(missing))
 
     # Check account structure (for provider conversations)
     if "account" in data:
@@ -81,18 +94,22 @@ def validate_conversation_structure(data: dict, filepath: Path) -> List[str]:
         if not isinstance(data["chat_messages"], list):
             errors.append("'chat_messages' should be a list")
         else:
+            # Hottest loop in the validator: bind the append and use a
+            # sentinel so each message costs two dict lookups, not four.
+            append_error = errors.append
             for i, msg in enumerate(data["chat_messages"]):
                 if not isinstance(msg, dict):
-                    errors.append(f"Message {i} is not a dictionary")
+                    append_error(f"Message {i} is not a dictionary")
                     continue
 
                 # Check message fields
                 if "uuid" not in msg:
-                    errors.append(f"Message {i} missing 'uuid'")
-                if "sender" not in msg:
-                    errors.append(f"Message {i} missing 'sender'")
-                elif msg["sender"] not in ["human", "assistant"]:
-                    errors.append(f"Message {i} has invalid sender: {msg['sender']}")
+                    append_error(f"Message {i} missing 'uuid'")
+                sender = msg.get("sender", _MISSING)
+                if sender is _MISSING:
+                    append_error(f"Message {i} missing 'sender'")
+                elif sender not in _VALID_SENDERS:
+                    append_error(f"Message {i} has invalid sender: {sender}")
 
     return errors
 
@@ -105,11 +122,9 @@ def validate_project_structure(data: dict, filepath: Path) -> List[str]:
     """
     errors = []
 
-    # Required top-level fields
-    required_fields = ["uuid", "name", "created_at"]
-    for field in required_fields:
-        if field not in data:
-            errors.append(f"Missing required field: {field}")
+    # Required top-level fields (sorted so error output stays deterministic)
+    missing = _REQUIRED_PROJECT_FIELDS - data.keys()
+    errors.extend(f"Missing required field: {field}" for field in sorted(missing))
 
     # Check creator structure
     if "creator" in data:
@@ -126,16 +141,29 @@ def validate_project_structure(data: dict, filepath: Path) -> List[str]:
     return errors
 
 
+def _read_bytes(path: str) -> bytes:
+    """Read a file's raw bytes; None if unreadable (reader-thread helper)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 def check_uuid_uniqueness(data_dir: Path) -> Tuple[bool, List[str]]:
     """
     Check that all conversation/project UUIDs are unique.
 
     Returns (success, error_messages).
     """
-    uuid_to_files: Dict[str, List[Path]] = {}
+    # defaultdict makes each record a single hash lookup instead of a
+    # membership test plus insert; entries hold the scandir path strings
+    # as-is — Path objects are only built for the (rare) duplicate report.
+    uuid_to_files: Dict[str, List[str]] = defaultdict(list)
     errors = []
 
-    # Scan provider directories (claude/, chatgpt/, etc.)
+    # Scan provider directories (claude/, chatgpt/, etc.). Conversations and
+    # projects get identical treatment, so one flattened loop covers both.
     for provider in ["claude", "chatgpt", "gemini"]:
         provider_dir = data_dir / provider
         if not provider_dir.exists():
@@ -145,40 +173,38 @@ def check_uuid_uniqueness(data_dir: Path) -> Tuple[bool, List[str]]:
             if not user_dir.is_dir():
                 continue
 
-            # Check conversations
-            conversations_dir = user_dir / "conversations"
-            if conversations_dir.exists():
-                for conv_file in conversations_dir.glob("*.json"):
-                    try:
-                        with open(conv_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            uuid = data.get("uuid")
-                            if uuid:
-                                if uuid not in uuid_to_files:
-                                    uuid_to_files[uuid] = []
-                                uuid_to_files[uuid].append(conv_file)
-                    except Exception:
-                        pass  # Will be caught by other validation
+            for subdir_name in ("conversations", "projects"):
+                subdir = user_dir / subdir_name
+                if not subdir.exists():
+                    continue
 
-            # Check projects
-            projects_dir = user_dir / "projects"
-            if projects_dir.exists():
-                for proj_file in projects_dir.glob("*.json"):
-                    try:
-                        with open(proj_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            uuid = data.get("uuid")
+                with os.scandir(subdir) as it:
+                    item_paths = [
+                        entry.path for entry in it
+                        if entry.name.endswith(".json") and entry.is_file()
+                    ]
+                # Prefetch file bytes on reader threads (open/read release
+                # the GIL) while this thread parses; bounded batches keep at
+                # most ~64 file contents in flight on big archives.
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    for start in range(0, len(item_paths), 64):
+                        batch = item_paths[start:start + 64]
+                        for item_path, buf in zip(batch, executor.map(_read_bytes, batch)):
+                            if buf is None:
+                                continue  # Will be caught by other validation
+                            try:
+                                uuid = json.loads(buf).get("uuid")
+                            except Exception:
+                                continue  # Will be caught by other validation
                             if uuid:
-                                if uuid not in uuid_to_files:
-                                    uuid_to_files[uuid] = []
-                                uuid_to_files[uuid].append(proj_file)
-                    except Exception:
-                        pass  # Will be caught by other validation
+                                uuid_to_files[uuid].append(item_path)
 
     # Find duplicates
     for uuid, files in uuid_to_files.items():
         if len(files) > 1:
-            file_list = ", ".join(str(f.relative_to(data_dir)) for f in files)
+            file_list = ", ".join(
+                str(Path(f).relative_to(data_dir)) for f in files
+            )
             errors.append(f"UUID {uuid} found in multiple files: {file_list}")
 
     return len(errors) == 0, errors
@@ -265,17 +291,14 @@ def main():
                 for conv_file in sorted(conversations_dir.glob("*.json")):
                     total_files += 1
 
-                    # Check JSON validity
-                    success, error = validate_json_file(conv_file)
+                    # Check JSON validity; the parse doubles as the read for
+                    # the structural checks below.
+                    success, error, data = validate_json_file(conv_file)
                     if not success:
                         print_error(f"{conv_file.name}: {error}")
                         total_errors += 1
                         continue
 
-                    # Check structure
-                    with open(conv_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
                     errors = validate_conversation_structure(data, conv_file)
                     if errors:
                         print_error(f"{conv_file.name}:")
@@ -289,17 +312,13 @@ def main():
                 for proj_file in sorted(projects_dir.glob("*.json")):
                     total_files += 1
 
-                    # Check JSON validity
-                    success, error = validate_json_file(proj_file)
+                    # Check JSON validity; reuse the parsed data as above.
+                    success, error, data = validate_json_file(proj_file)
                     if not success:
                         print_error(f"{proj_file.name}: {error}")
                         total_errors += 1
                         continue
 
-                    # Check structure
-                    with open(proj_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
                     errors = validate_project_structure(data, proj_file)
                     if errors:
                         print_error(f"{proj_file.name}:")
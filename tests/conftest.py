@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures for integration tests.
 """
 import json
 import os
+import shutil
 import subprocess
 import sys
 import zipfile
@@ -79,12 +80,13 @@ def fixtures_dir():
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-def sample_claude_export(fixtures_dir, tmp_path):
+def _write_sample_claude_export(zip_path: Path) -> Path:
     """
-    Create a valid Claude export zip file with sample conversations and projects.
+    Write the canonical sample Claude export zip to ``zip_path``.
 
-    Returns the path to the zip file.
+    Shared by the ``sample_claude_export`` fixture and the session-scoped
+    ``synced_claude_template`` below, which needs the same data at session
+    scope where function-scoped fixtures are unavailable.
     """
     # Create sample data structure
     users_data = [
@@ -179,16 +181,27 @@ def sample_claude_export(fixtures_dir, tmp_path):
         }
     ]
 
-    # Create zip file
-    zip_path = tmp_path / "data-2025-01-05.zip"
-    with zipfile.ZipFile(zip_path, 'w') as zf:
-        zf.writestr("users.json", json.dumps(users_data, indent=2))
-        zf.writestr("conversations.json", json.dumps(conversations_data, indent=2))
-        zf.writestr("projects.json", json.dumps(projects_data, indent=2))
+    # Create zip file. Stored (uncompressed) and compact: deflating a few KiB
+    # of test data on every fixture invocation buys nothing, and the sync
+    # scripts never see the member formatting — only the parsed objects.
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("users.json", json.dumps(users_data))
+        zf.writestr("conversations.json", json.dumps(conversations_data))
+        zf.writestr("projects.json", json.dumps(projects_data))
 
     return zip_path
 
 
+@pytest.fixture
+def sample_claude_export(tmp_path):
+    """
+    Create a valid Claude export zip file with sample conversations and projects.
+
+    Returns the path to the zip file.
+    """
+    return _write_sample_claude_export(tmp_path / "data-2025-01-05.zip")
+
+
 @pytest.fixture
 def sample_chatgpt_export(tmp_path):
     """
@@ -250,13 +263,46 @@ def sample_chatgpt_export(tmp_path):
 
     # ChatGPT export has hex-based filename (64 hex chars + date + hex)
     zip_path = tmp_path / "a1b2c3d4e5f67890123456789012345678901234567890123456789012345678-2025-01-05-12-00-00-abcdef.zip"
-    with zipfile.ZipFile(zip_path, 'w') as zf:
-        zf.writestr("user.json", json.dumps(user_data, indent=2))
-        zf.writestr("conversations.json", json.dumps(conversations_data, indent=2))
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("user.json", json.dumps(user_data))
+        zf.writestr("conversations.json", json.dumps(conversations_data))
 
     return zip_path
 
 
+def _write_workspace_env(workspace: Path) -> Path:
+    """Write a workspace-local .env pointing every path at ``workspace``."""
+    env_content = f"""# Test configuration
+ZIP_SEARCH_DIR={workspace}
+LLM_DATA_DIR={workspace / "data" / "llm_data"}
+ARCHIVED_EXPORTS_DIR={workspace / "data" / "archived_exports"}
+LOCAL_VIEWS_DIR={workspace / "data" / "local_views"}
+SEARCH_INDEX_DB={workspace / "search_index.db"}
+"""
+    env_path = workspace / ".env"
+    env_path.write_text(env_content)
+    return env_path
+
+
+@pytest.fixture
+def stage_fixture_zip():
+    """Return a helper that places an immutable fixture zip at a destination.
+
+    Hardlinks instead of copying — zero data bytes move, one inode op. The
+    sync script archives a consumed zip by *renaming* it, which only drops
+    the destination name; the fixture's own path keeps the inode alive, so
+    the original stays intact. Falls back to ``shutil.copy`` where linking
+    isn't possible (e.g. fixture and workspace on different filesystems).
+    """
+    def _stage(src: Path, dst: Path) -> Path:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy(src, dst)
+        return dst
+    return _stage
+
+
 @pytest.fixture
 def test_env_file(request):
     """
@@ -273,17 +319,32 @@ def test_env_file(request):
     """
     # Get the isolated_workspace from the test's fixtures
     workspace = request.getfixturevalue('isolated_workspace')
+    return _write_workspace_env(workspace)
 
-    env_content = f"""# Test configuration
-ZIP_SEARCH_DIR={workspace}
-LLM_DATA_DIR={workspace / "data" / "llm_data"}
-ARCHIVED_EXPORTS_DIR={workspace / "data" / "archived_exports"}
-LOCAL_VIEWS_DIR={workspace / "data" / "local_views"}
-SEARCH_INDEX_DB={workspace / "search_index.db"}
-"""
-    env_path = workspace / ".env"
-    env_path.write_text(env_content)
-    return env_path
+
+def _run_script(repo_root: Path, sandbox_home: Path, script: str, *args: str,
+                config, **kwargs):
+    """Run an entry-point script sandboxed — shared engine behind ``run_cli``.
+
+    Also used directly by the session-scoped ``synced_claude_template``
+    fixture, which cannot depend on the function-scoped ``run_cli``.
+    """
+    sandbox_cache = sandbox_home / ".cache"
+    sandbox_cache.mkdir(parents=True, exist_ok=True)
+    kwargs.setdefault("capture_output", True)
+    kwargs.setdefault("text", True)
+    env = {
+        **os.environ,
+        "HOME": str(sandbox_home),
+        "XDG_CACHE_HOME": str(sandbox_cache),
+        "CODEX_HOME": str(sandbox_home / ".codex"),
+        **kwargs.pop("env", {}),
+    }
+    return subprocess.run(
+        [sys.executable, str(repo_root / script),
+         "--config", str(config), *args],
+        env=env, **kwargs,
+    )
 
 
 @pytest.fixture
@@ -307,24 +368,10 @@ def run_cli(repo_root, tmp_path):
     ``subprocess.run``; ``capture_output``/``text`` default to True.
     """
     sandbox_home = tmp_path / "home"
-    sandbox_cache = sandbox_home / ".cache"
-    sandbox_cache.mkdir(parents=True, exist_ok=True)
 
     def _run(script: str, *args: str, config, **kwargs):
-        kwargs.setdefault("capture_output", True)
-        kwargs.setdefault("text", True)
-        env = {
-            **os.environ,
-            "HOME": str(sandbox_home),
-            "XDG_CACHE_HOME": str(sandbox_cache),
-            "CODEX_HOME": str(sandbox_home / ".codex"),
-            **kwargs.pop("env", {}),
-        }
-        return subprocess.run(
-            [sys.executable, str(repo_root / script),
-             "--config", str(config), *args],
-            env=env, **kwargs,
-        )
+        return _run_script(repo_root, sandbox_home, script, *args,
+                           config=config, **kwargs)
     return _run
 
 
@@ -367,7 +414,54 @@ def prepopulated_archive(isolated_workspace):
     return isolated_workspace
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def repo_root():
     """Return the path to the repository root."""
     return Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def synced_claude_template(tmp_path_factory, repo_root):
+    """
+    Run the Claude sync ONCE per session and return the resulting workspace.
+
+    Most search/view tests need "a workspace where the sample export has
+    already been synced" and were each paying a full subprocess sync to build
+    an identical tree. This template pays that cost once. Tests must never
+    touch the template directly — use ``synced_claude_workspace``, which
+    clones it, so each test still gets private, mutable state.
+    """
+    template = tmp_path_factory.mktemp("synced-claude-template")
+    (template / "data" / "llm_data").mkdir(parents=True)
+    (template / "data" / "archived_exports").mkdir()
+    (template / "data" / "local_views").mkdir()
+
+    _write_sample_claude_export(template / "data-2025-01-05.zip")
+    env_path = _write_workspace_env(template)
+
+    result = _run_script(
+        repo_root, template / "sandbox-home",
+        "sync_local_chats_archive.py", "--claude",
+        config=env_path, cwd=template,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Template sync failed:\n{result.stdout}\n{result.stderr}"
+        )
+    return template
+
+
+@pytest.fixture
+def synced_claude_workspace(synced_claude_template, isolated_workspace):
+    """
+    Per-test isolated workspace pre-loaded with a synced Claude archive.
+
+    Clones the session template's data/ tree into this test's workspace, so
+    the test starts from "sync already ran" without spawning a sync
+    subprocess of its own. The clone is private to the test — mutate freely.
+    """
+    shutil.copytree(
+        synced_claude_template / "data", isolated_workspace / "data",
+        dirs_exist_ok=True,
+    )
+    return isolated_workspace
@@ -65,7 +65,7 @@ def _assert_index_matches_scan(repo_root, workspace, *args):
 
 @pytest.fixture
 def full_archive_workspace(isolated_workspace, sample_claude_export,
-                           sample_chatgpt_export, repo_root):
+                           sample_chatgpt_export, repo_root, stage_fixture_zip):
     """Workspace with claude + chatgpt + claude-code data and an .env whose
     SEARCH_INDEX_DB points inside the workspace."""
     # Claude Code session data
@@ -102,8 +102,8 @@ def full_archive_workspace(isolated_workspace, sample_claude_export,
     )
 
     # Sync both providers' export zips into the archive
-    shutil.copy(sample_claude_export, isolated_workspace / sample_claude_export.name)
-    shutil.copy(sample_chatgpt_export, isolated_workspace / sample_chatgpt_export.name)
+    stage_fixture_zip(sample_claude_export, isolated_workspace / sample_claude_export.name)
+    stage_fixture_zip(sample_chatgpt_export, isolated_workspace / sample_chatgpt_export.name)
     for flag in ("--claude", "--chatgpt"):
         sync = _run_cli(repo_root, isolated_workspace, "sync_local_chats_archive.py", flag)
         assert sync.returncode == 0, f"Setup sync {flag} failed: {sync.stderr}"
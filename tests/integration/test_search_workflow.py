@@ -4,28 +4,17 @@ Integration tests for search workflow (full_text_search_chats_archive.py).
 These tests exercise the search functionality with real data.
 """
 import json
-import shutil
 
 import pytest
 
 
 @pytest.mark.integration
-def test_search_exact_phrase_match(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_search_exact_phrase_match(synced_claude_workspace, run_cli, test_env_file):
     """Test searching for an exact phrase in conversations."""
-    # Setup: Import conversations first
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0, "Setup sync failed"
-
     # Execute: Search for phrase that exists in test data
     result = run_cli(
         "full_text_search_chats_archive.py", "Python function",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nSearch STDOUT:\n{result.stdout}")
@@ -40,22 +29,12 @@ def test_search_exact_phrase_match(isolated_workspace, sample_claude_export, run
 
 
 @pytest.mark.integration
-def test_search_json_output(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_search_json_output(synced_claude_workspace, run_cli, test_env_file):
     """Test search with JSON output format."""
-    # Setup: Import conversations
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: Search with JSON output
     result = run_cli(
         "full_text_search_chats_archive.py", "integration testing", "-j",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nJSON Search STDOUT:\n{result.stdout}")
@@ -86,34 +65,23 @@ def test_search_json_output(isolated_workspace, sample_claude_export, run_cli, t
 
 
 @pytest.mark.integration
-def test_search_cross_provider(isolated_workspace, sample_claude_export, sample_chatgpt_export,
-                                test_env_file, run_cli):
+def test_search_cross_provider(synced_claude_workspace, sample_chatgpt_export,
+                                test_env_file, run_cli, stage_fixture_zip):
     """Test searching across both Claude and ChatGPT conversations."""
-    # Setup: Import both Claude and ChatGPT conversations
-    claude_zip = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, claude_zip)
-
-    chatgpt_zip = isolated_workspace / sample_chatgpt_export.name
-    shutil.copy(sample_chatgpt_export, chatgpt_zip)
-
-    # Sync Claude
-    sync_claude = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_claude.returncode == 0
+    # Setup: Claude data comes pre-synced with the workspace; add ChatGPT
+    chatgpt_zip = synced_claude_workspace / sample_chatgpt_export.name
+    stage_fixture_zip(sample_chatgpt_export, chatgpt_zip)
 
-    # Sync ChatGPT
     sync_chatgpt = run_cli(
         "sync_local_chats_archive.py", "--chatgpt",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
     assert sync_chatgpt.returncode == 0
 
     # Execute: Search for term that appears in ChatGPT conversation
     result = run_cli(
         "full_text_search_chats_archive.py", "ChatGPT", "-j",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nCross-provider search:\n{result.stdout}")
@@ -141,7 +109,7 @@ def test_search_cross_provider(isolated_workspace, sample_claude_export, sample_
 
 @pytest.mark.integration
 def test_search_finds_chatgpt_message_body(isolated_workspace, sample_chatgpt_export,
-                                            test_env_file, run_cli):
+                                            test_env_file, run_cli, stage_fixture_zip):
     """Search must index ChatGPT message bodies (mapping format), not just titles.
 
     Regression: ChatGPT exports use a `mapping` of nodes with
@@ -149,7 +117,7 @@ def test_search_finds_chatgpt_message_body(isolated_workspace, sample_chatgpt_ex
     chat_messages array, so message text was invisible to search.
     """
     chatgpt_zip = isolated_workspace / sample_chatgpt_export.name
-    shutil.copy(sample_chatgpt_export, chatgpt_zip)
+    stage_fixture_zip(sample_chatgpt_export, chatgpt_zip)
 
     sync_chatgpt = run_cli(
         "sync_local_chats_archive.py", "--chatgpt",
@@ -174,22 +142,12 @@ def test_search_finds_chatgpt_message_body(isolated_workspace, sample_chatgpt_ex
 
 
 @pytest.mark.integration
-def test_search_no_results(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_search_no_results(synced_claude_workspace, run_cli, test_env_file):
     """Test search with query that has no matches."""
-    # Setup: Import conversations
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: Search for non-existent term
     result = run_cli(
         "full_text_search_chats_archive.py", "xyzabc123nonexistentterm",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nNo results search:\n{result.stdout}")
@@ -202,24 +160,14 @@ def test_search_no_results(isolated_workspace, sample_claude_export, run_cli, te
 
 
 @pytest.mark.integration
-def test_search_multi_term_default(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_search_multi_term_default(synced_claude_workspace, run_cli, test_env_file):
     """Test that default search finds conversations containing all words individually (AND logic)."""
-    # Setup: Import conversations first
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0, "Setup sync failed"
-
     # "write" and "keyword" both appear in conv-uuid-001 but NOT as a contiguous phrase
     # "write" is in "How do I write a Python function?"
     # "keyword" is in "Here's how to write a Python function with def keyword."
     result = run_cli(
         "full_text_search_chats_archive.py", "write keyword",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nMulti-term search STDOUT:\n{result.stdout}")
@@ -230,22 +178,12 @@ def test_search_multi_term_default(isolated_workspace, sample_claude_export, run
 
 
 @pytest.mark.integration
-def test_search_exact_flag(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_search_exact_flag(synced_claude_workspace, run_cli, test_env_file):
     """Test that -e/--exact flag restores exact-phrase behavior."""
-    # Setup: Import conversations first
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0, "Setup sync failed"
-
     # With -e, "write keyword" should NOT match (not a contiguous phrase)
     result_no_match = run_cli(
         "full_text_search_chats_archive.py", "-e", "write keyword",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nExact non-match STDOUT:\n{result_no_match.stdout}")
@@ -257,7 +195,7 @@ def test_search_exact_flag(isolated_workspace, sample_claude_export, run_cli, te
     # With -e, "Python function" SHOULD match (it IS a contiguous phrase)
     result_match = run_cli(
         "full_text_search_chats_archive.py", "-e", "Python function",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nExact match STDOUT:\n{result_match.stdout}")
@@ -268,22 +206,13 @@ def test_search_exact_flag(isolated_workspace, sample_claude_export, run_cli, te
 
 
 @pytest.mark.integration
-def test_search_no_query_browses_all_newest_first(isolated_workspace, sample_claude_export,
+def test_search_no_query_browses_all_newest_first(synced_claude_workspace,
                                                   run_cli, test_env_file):
     """With no query, every item is returned ordered by updated_at descending."""
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # No positional query — browse mode.
     result = run_cli(
         "full_text_search_chats_archive.py", "-j",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
     assert result.returncode == 0, f"Browse failed: {result.stderr}"
 
@@ -304,22 +233,12 @@ def test_search_no_query_browses_all_newest_first(isolated_workspace, sample_cla
 
 
 @pytest.mark.integration
-def test_search_scoring_accuracy(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_search_scoring_accuracy(synced_claude_workspace, run_cli, test_env_file):
     """Test that search scoring ranks results correctly."""
-    # Setup: Import conversations
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: Search with JSON to get scores
     result = run_cli(
         "full_text_search_chats_archive.py", "integration testing", "-j",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     assert result.returncode == 0
@@ -3,18 +3,36 @@ Integration tests for sync workflow (sync_local_chats_archive.py).
 
 These tests exercise the full sync pipeline with real filesystem operations.
 """
+import hashlib
 import json
 import shutil
 
 import pytest
 
 
+def _tree_digest(root):
+    """One digest over every file under root: sorted (relpath, content).
+
+    Byte-exact equality of two digests means the trees are identical —
+    a strictly stronger idempotency check than counting files and
+    spot-reading one of them.
+    """
+    digest = hashlib.blake2b()
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            digest.update(str(path.relative_to(root)).encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
 @pytest.mark.integration
-def test_fresh_claude_import(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_fresh_claude_import(isolated_workspace, sample_claude_export, run_cli, test_env_file,
+                             stage_fixture_zip):
     """Test importing Claude conversations into an empty archive."""
-    # Setup: Copy export zip to workspace
+    # Setup: Stage export zip in workspace
     zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
+    stage_fixture_zip(sample_claude_export, zip_dest)
 
     # Execute: Run sync script
     result = run_cli(
@@ -69,7 +87,8 @@ def test_fresh_claude_import(isolated_workspace, sample_claude_export, run_cli,
 
 
 @pytest.mark.integration
-def test_conversation_update(prepopulated_archive, sample_claude_export, run_cli, test_env_file):
+def test_conversation_update(prepopulated_archive, sample_claude_export, run_cli, test_env_file,
+                             stage_fixture_zip):
     """Test updating an existing conversation with same UUID."""
     # Setup: Workspace already has old version of conv-uuid-001
     workspace = prepopulated_archive
@@ -82,9 +101,9 @@ def test_conversation_update(prepopulated_archive, sample_claude_export, run_cli
     old_conv = json.loads(old_files[0].read_text())
     assert old_conv["name"] == "Old Version of Test Conversation"
 
-    # Setup: Copy new export zip
+    # Setup: Stage new export zip
     zip_dest = workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
+    stage_fixture_zip(sample_claude_export, zip_dest)
 
     # Execute: Run sync script
     result = run_cli(
@@ -116,11 +135,12 @@ def test_conversation_update(prepopulated_archive, sample_claude_export, run_cli
 
 
 @pytest.mark.integration
-def test_chatgpt_import(isolated_workspace, sample_chatgpt_export, test_env_file, run_cli):
+def test_chatgpt_import(isolated_workspace, sample_chatgpt_export, test_env_file, run_cli,
+                        stage_fixture_zip):
     """Test importing ChatGPT conversations with .env configuration."""
-    # Setup: Copy export zip
+    # Setup: Stage export zip
     zip_dest = isolated_workspace / sample_chatgpt_export.name
-    shutil.copy(sample_chatgpt_export, zip_dest)
+    stage_fixture_zip(sample_chatgpt_export, zip_dest)
 
     # Verify .env exists
     assert test_env_file.exists(), ".env file not created"
@@ -151,11 +171,12 @@ def test_chatgpt_import(isolated_workspace, sample_chatgpt_export, test_env_file
 
 
 @pytest.mark.integration
-def test_filename_collision_handling(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_filename_collision_handling(isolated_workspace, sample_claude_export, run_cli,
+                                     test_env_file, stage_fixture_zip):
     """Test that filename collisions are resolved with numeric suffixes."""
-    # Setup: Copy export zip
+    # Setup: Stage export zip
     zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
+    stage_fixture_zip(sample_claude_export, zip_dest)
 
     # Run sync once
     result1 = run_cli(
@@ -199,24 +220,39 @@ def test_filename_collision_handling(isolated_workspace, sample_claude_export, r
 
 
 @pytest.mark.integration
-def test_multiple_syncs_idempotent(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_multiple_syncs_idempotent(isolated_workspace, sample_claude_export, run_cli,
+                                   test_env_file, stage_fixture_zip):
     """Test that running sync multiple times with same data is idempotent."""
     # Setup
     zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    # Run sync three times
-    for i in range(3):
-        # Need to restore the zip file since it gets archived
-        if i > 0:
-            archived = isolated_workspace / "data/archived_exports/claude/claude-test@example.com/data-2025-01-05.zip"
-            shutil.copy(archived, zip_dest)
-
-        result = run_cli(
-            "sync_local_chats_archive.py", "--claude",
-            config=test_env_file, cwd=isolated_workspace,
-        )
-        assert result.returncode == 0, f"Sync {i+1} failed"
+    stage_fixture_zip(sample_claude_export, zip_dest)
+
+    # First sync populates the archive
+    result = run_cli(
+        "sync_local_chats_archive.py", "--claude",
+        config=test_env_file, cwd=isolated_workspace,
+    )
+    assert result.returncode == 0, "Sync 1 failed"
+
+    llm_data = isolated_workspace / "data/llm_data"
+    digest_after_first = _tree_digest(llm_data)
+
+    # Restore the zip (it gets archived) and sync again. This stays a real
+    # copy: hardlinking the archived zip back would leave workspace and
+    # archive sharing an inode, and the next sync's rename of that inode
+    # onto itself is a POSIX no-op that strands the workspace copy.
+    archived = isolated_workspace / "data/archived_exports/claude/claude-test@example.com/data-2025-01-05.zip"
+    shutil.copy(archived, zip_dest)
+
+    result = run_cli(
+        "sync_local_chats_archive.py", "--claude",
+        config=test_env_file, cwd=isolated_workspace,
+    )
+    assert result.returncode == 0, "Sync 2 failed"
+
+    # Verify: the second sync changed nothing, byte for byte
+    assert _tree_digest(llm_data) == digest_after_first, \
+        "Second sync with identical data modified the archive"
 
     # Verify: Still have exactly the right number of files
     conv_dir = isolated_workspace / "data/llm_data/claude/claude-test@example.com/conversations"
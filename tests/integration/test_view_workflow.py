@@ -1,36 +1,37 @@
 """
 Integration tests for view workflow (view_conversation.py).
 
-These tests exercise conversation viewing and format conversion.
+These tests exercise conversation viewing and format conversion. Every test
+starts from ``synced_claude_workspace`` — a private clone of the
+session-scoped synced archive — so no test pays for its own sync subprocess.
 """
 import json
-import shutil
 
 import pytest
 
 
-def _import_export(isolated_workspace, sample_claude_export, run_cli, config):
-    """Copy the sample export into the workspace and run the sync script."""
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=config, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
+def _file_key(path):
+    """(st_mtime_ns, st_size) — a rewrite detector that survives coarse clocks.
+
+    Float st_mtime is second-resolution on some filesystems, so two writes
+    inside one second would compare equal; nanosecond mtime plus size
+    doesn't have that hole.
+    """
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
 
 
-def _view(isolated_workspace, run_cli, config, uuid):
+def _view(workspace, run_cli, config, uuid):
     """Run view_conversation.py for a UUID in markdown mode without opening it."""
     return run_cli(
         "view_conversation.py", uuid, "--format", "markdown", "--no-open",
-        config=config, cwd=isolated_workspace,
+        config=config, cwd=workspace,
     )
 
 
-def _append_message(isolated_workspace, uuid, text, sender="assistant"):
+def _append_message(workspace, uuid, text, sender="assistant"):
     """Append a chat message to a stored Claude conversation JSON."""
-    conv_dir = (isolated_workspace
+    conv_dir = (workspace
                 / "data/llm_data/claude/claude-test@example.com/conversations")
     conv_files = list(conv_dir.glob("*.json"))
     for path in conv_files:
@@ -52,22 +53,12 @@ def _append_message(isolated_workspace, uuid, text, sender="assistant"):
 
 
 @pytest.mark.integration
-def test_view_markdown_format(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_markdown_format(synced_claude_workspace, run_cli, test_env_file):
     """Test viewing a conversation in Markdown format."""
-    # Setup: Import conversations first
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: View conversation in markdown (without opening editor)
     result = run_cli(
         "view_conversation.py", "conv-uuid-001", "--format", "markdown", "--no-open",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nView STDOUT:\n{result.stdout}")
@@ -77,7 +68,7 @@ def test_view_markdown_format(isolated_workspace, sample_claude_export, run_cli,
     assert result.returncode == 0, f"View failed: {result.stderr}"
 
     # Verify: Markdown file was created
-    md_file = isolated_workspace / "data/local_views/claude/conv-uuid-001.md"
+    md_file = synced_claude_workspace / "data/local_views/claude/conv-uuid-001.md"
     assert md_file.exists(), "Markdown file not created"
 
     # Verify: Markdown content is correct
@@ -89,22 +80,12 @@ def test_view_markdown_format(isolated_workspace, sample_claude_export, run_cli,
 
 
 @pytest.mark.integration
-def test_view_html_format(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_html_format(synced_claude_workspace, run_cli, test_env_file):
     """Test viewing a conversation in HTML format."""
-    # Setup: Import conversations
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: View conversation in HTML format (without opening browser)
     result = run_cli(
         "view_conversation.py", "conv-uuid-002", "--format", "html", "--no-open",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nView HTML STDOUT:\n{result.stdout}")
@@ -114,16 +95,17 @@ def test_view_html_format(isolated_workspace, sample_claude_export, run_cli, tes
     assert result.returncode == 0, f"View failed: {result.stderr}"
 
     # Verify: HTML file was created
-    html_file = isolated_workspace / "data/local_views/claude/conv-uuid-002.html"
+    html_file = synced_claude_workspace / "data/local_views/claude/conv-uuid-002.html"
     assert html_file.exists(), "HTML file not created"
 
-    # Verify: HTML content is correct
+    # Verify: HTML content is correct (lowercase once, not per assertion)
     html_content = html_file.read_text()
-    assert "<html" in html_content.lower(), "Not valid HTML"
+    html_lower = html_content.lower()
+    assert "<html" in html_lower, "Not valid HTML"
     assert "Integration Testing Discussion" in html_content, "Title not in HTML"
-    assert "integration testing" in html_content.lower(), "Message content not in HTML"
-    assert "<head>" in html_content.lower(), "HTML structure missing"
-    assert "<body>" in html_content.lower(), "HTML structure missing"
+    assert "integration testing" in html_lower, "Message content not in HTML"
+    assert "<head>" in html_lower, "HTML structure missing"
+    assert "<body>" in html_lower, "HTML structure missing"
 
     # Verify: Markdown in messages is rendered to HTML, not shown as raw text
     assert "<strong>isolated workspaces</strong>" in html_content, "Bold not rendered"
@@ -136,7 +118,7 @@ def test_view_html_format(isolated_workspace, sample_claude_export, run_cli, tes
     # Verify: the page links the shared stylesheet rather than embedding CSS
     assert '<link rel="stylesheet" href="../assets/conversation.css">' in html_content, \
         "Stylesheet not linked"
-    css_file = isolated_workspace / "data/local_views/assets/conversation.css"
+    css_file = synced_claude_workspace / "data/local_views/assets/conversation.css"
     assert css_file.exists(), "Shared stylesheet not deployed"
     css_content = css_file.read_text()
     assert ".highlight" in css_content, "Pygments CSS not in stylesheet"
@@ -144,22 +126,12 @@ def test_view_html_format(isolated_workspace, sample_claude_export, run_cli, tes
 
 
 @pytest.mark.integration
-def test_view_nonexistent_conversation(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_nonexistent_conversation(synced_claude_workspace, run_cli, test_env_file):
     """Test viewing a conversation that doesn't exist."""
-    # Setup: Import conversations
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: Try to view non-existent conversation
     result = run_cli(
         "view_conversation.py", "nonexistent-uuid-999", "--no-open",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nNonexistent conversation output:\n{result.stdout}\n{result.stderr}")
@@ -170,75 +142,60 @@ def test_view_nonexistent_conversation(isolated_workspace, sample_claude_export,
 
 
 @pytest.mark.integration
-def test_view_caching(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_caching(synced_claude_workspace, run_cli, test_env_file):
     """Test that viewing the same conversation twice reuses cached file."""
-    # Setup: Import conversations
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: View conversation first time
     result1 = run_cli(
         "view_conversation.py", "conv-uuid-001", "--format", "markdown", "--no-open",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
     assert result1.returncode == 0
 
-    # Get file modification time
-    md_file = isolated_workspace / "data/local_views/claude/conv-uuid-001.md"
-    first_mtime = md_file.stat().st_mtime
+    # Get file identity (nanosecond mtime + size)
+    md_file = synced_claude_workspace / "data/local_views/claude/conv-uuid-001.md"
+    first_key = _file_key(md_file)
 
     # Execute: View same conversation again
     result2 = run_cli(
         "view_conversation.py", "conv-uuid-001", "--format", "markdown", "--no-open",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
     assert result2.returncode == 0
 
-    # Verify: File modification time hasn't changed (file was reused)
-    second_mtime = md_file.stat().st_mtime
-    assert first_mtime == second_mtime, "File should be reused, not regenerated"
+    # Verify: File identity hasn't changed (file was reused)
+    assert _file_key(md_file) == first_key, "File should be reused, not regenerated"
 
 
 @pytest.mark.integration
-def test_view_refresh_stale(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_refresh_stale(synced_claude_workspace, run_cli, test_env_file):
     """A cached markdown is refreshed when the conversation gained new messages."""
-    _import_export(isolated_workspace, sample_claude_export, run_cli, test_env_file)
-
-    assert _view(isolated_workspace, run_cli, test_env_file, "conv-uuid-001").returncode == 0
+    assert _view(synced_claude_workspace, run_cli, test_env_file, "conv-uuid-001").returncode == 0
 
     new_text = "This is a freshly appended assistant reply."
-    _append_message(isolated_workspace, "conv-uuid-001", new_text)
+    _append_message(synced_claude_workspace, "conv-uuid-001", new_text)
 
-    result = _view(isolated_workspace, run_cli, test_env_file, "conv-uuid-001")
+    result = _view(synced_claude_workspace, run_cli, test_env_file, "conv-uuid-001")
     print(f"\nRefresh STDOUT:\n{result.stdout}")
     assert result.returncode == 0
     assert "refreshed" in result.stdout.lower()
 
-    md_file = isolated_workspace / "data/local_views/claude/conv-uuid-001.md"
+    md_file = synced_claude_workspace / "data/local_views/claude/conv-uuid-001.md"
     assert new_text in md_file.read_text(), "New message not added to refreshed markdown"
 
 
 @pytest.mark.integration
-def test_view_preserves_edits(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_preserves_edits(synced_claude_workspace, run_cli, test_env_file):
     """A hand-edited markdown is left untouched even when the conversation grew."""
-    _import_export(isolated_workspace, sample_claude_export, run_cli, test_env_file)
+    assert _view(synced_claude_workspace, run_cli, test_env_file, "conv-uuid-001").returncode == 0
 
-    assert _view(isolated_workspace, run_cli, test_env_file, "conv-uuid-001").returncode == 0
-
-    md_file = isolated_workspace / "data/local_views/claude/conv-uuid-001.md"
+    md_file = synced_claude_workspace / "data/local_views/claude/conv-uuid-001.md"
     marker = "LOCAL EDIT MARKER — do not clobber"
     md_file.write_text(md_file.read_text() + f"\n{marker}\n")
 
     new_text = "This appended reply must NOT reach the edited file."
-    _append_message(isolated_workspace, "conv-uuid-001", new_text)
+    _append_message(synced_claude_workspace, "conv-uuid-001", new_text)
 
-    result = _view(isolated_workspace, run_cli, test_env_file, "conv-uuid-001")
+    result = _view(synced_claude_workspace, run_cli, test_env_file, "conv-uuid-001")
     print(f"\nPreserve-edits STDOUT:\n{result.stdout}")
     assert result.returncode == 0
     assert "local edits" in result.stdout.lower()
@@ -249,37 +206,25 @@ def test_view_preserves_edits(isolated_workspace, sample_claude_export, run_cli,
 
 
 @pytest.mark.integration
-def test_view_current_no_rewrite(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_current_no_rewrite(synced_claude_workspace, run_cli, test_env_file):
     """Viewing an unchanged conversation reports it up to date and does not rewrite."""
-    _import_export(isolated_workspace, sample_claude_export, run_cli, test_env_file)
-
-    assert _view(isolated_workspace, run_cli, test_env_file, "conv-uuid-001").returncode == 0
-    md_file = isolated_workspace / "data/local_views/claude/conv-uuid-001.md"
-    first_mtime = md_file.stat().st_mtime
+    assert _view(synced_claude_workspace, run_cli, test_env_file, "conv-uuid-001").returncode == 0
+    md_file = synced_claude_workspace / "data/local_views/claude/conv-uuid-001.md"
+    first_key = _file_key(md_file)
 
-    result = _view(isolated_workspace, run_cli, test_env_file, "conv-uuid-001")
+    result = _view(synced_claude_workspace, run_cli, test_env_file, "conv-uuid-001")
     assert result.returncode == 0
     assert "up to date" in result.stdout.lower()
-    assert md_file.stat().st_mtime == first_mtime, "File should not be rewritten"
+    assert _file_key(md_file) == first_key, "File should not be rewritten"
 
 
 @pytest.mark.integration
-def test_view_project(isolated_workspace, sample_claude_export, run_cli, test_env_file):
+def test_view_project(synced_claude_workspace, run_cli, test_env_file):
     """Test viewing a Claude project."""
-    # Setup: Import conversations and projects
-    zip_dest = isolated_workspace / "data-2025-01-05.zip"
-    shutil.copy(sample_claude_export, zip_dest)
-
-    sync_result = run_cli(
-        "sync_local_chats_archive.py", "--claude",
-        config=test_env_file, cwd=isolated_workspace,
-    )
-    assert sync_result.returncode == 0
-
     # Execute: View project
     result = run_cli(
         "view_conversation.py", "proj-uuid-001", "--format", "markdown", "--no-open",
-        config=test_env_file, cwd=isolated_workspace,
+        config=test_env_file, cwd=synced_claude_workspace,
     )
 
     print(f"\nView project STDOUT:\n{result.stdout}")
@@ -288,7 +233,7 @@ def test_view_project(isolated_workspace, sample_claude_export, run_cli, test_en
     assert result.returncode == 0, f"View project failed: {result.stderr}"
 
     # Verify: Markdown file created
-    md_file = isolated_workspace / "data/local_views/claude/proj-uuid-001.md"
+    md_file = synced_claude_workspace / "data/local_views/claude/proj-uuid-001.md"
     assert md_file.exists(), "Project markdown file not created"
 
     # Verify: Project content included
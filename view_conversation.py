@@ -11,9 +11,11 @@ import functools
 import html
 import json
 import os
+import re
 import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -21,6 +23,20 @@ from typing import Optional
 import providers
 from paths import resolve_data_dir, resolve_local_views_dir, parse_claude_code_sources, parse_codex_sources, resolve_env_path, load_env_file, open_in_editor
 
+# orjson (optional) parses JSON in C — the dominant cost when a lookup falls
+# back to scanning whole multi-MB conversation files. Same pattern as the
+# sync script: use it when installed, stdlib otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes/str with orjson when available, stdlib otherwise."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 CLAUDE_CHAT_URL_PREFIX = "https://claude.ai/chat/"
 
 
@@ -56,22 +72,87 @@ def find_conversation_file_via_index(config: dict, uuid: str) -> Optional[tuple[
     if not hit:
         return None
     path, provider = hit
+    # Verify with the bounded uuid peek so a warm run never parses the file
+    # twice — the one full parse happens later, in render_conversation.
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            if json.load(f).get("uuid") == uuid:
+        peeked = _peek_top_level_uuid(path)
+        if peeked is not None:
+            if peeked == uuid:
                 return path, provider
+        else:
+            with open(path, "rb") as f:
+                if _json_loads(f.read()).get("uuid") == uuid:
+                    return path, provider
     except Exception:
         pass
     return None
 
 
+# The sync script stores every item with indent=2, which pins top-level keys
+# to exactly two spaces — so a bounded read plus this anchored regex can pull
+# the uuid out without parsing the file. (The sync script relies on the same
+# contract for its own skip-unchanged peek.)
+_PEEK_UUID_RE = re.compile(rb'^  "uuid": "([^"\\]+)"', re.M)
+_PEEK_BYTES = 4096
+
+
+def _peek_top_level_uuid(path) -> Optional[str]:
+    """Read a stored item's top-level uuid from a bounded prefix/suffix.
+
+    Claude items carry uuid as their first key (head read); normalized
+    ChatGPT items carry it after the message mapping (tail read). None means
+    neither bounded read found it and the caller must parse the whole file.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_PEEK_BYTES)
+        m = _PEEK_UUID_RE.search(head)
+        if m is None:
+            size = os.fstat(f.fileno()).st_size
+            if size > _PEEK_BYTES:
+                f.seek(size - _PEEK_BYTES)
+                tail = f.read(_PEEK_BYTES)
+                # Skip the partial first line: a truncated nested line could
+                # open the buffer with two spaces and pass for top-level.
+                nl = tail.find(b"\n")
+                if nl != -1:
+                    m = _PEEK_UUID_RE.search(tail, nl + 1)
+    if m is None:
+        return None
+    return m.group(1).decode("utf-8", errors="replace")
+
+
 def find_conversation_file(data_dir: Path, uuid: str) -> Optional[tuple[Path, str]]:
     """
     Find the JSON file for a given conversation UUID.
 
     Returns tuple of (file_path, provider) or None if not found.
     """
-    # Search in both claude/ and chatgpt/ subdirectories
+    # Conversations and projects get identical treatment, so one scan routine
+    # covers both; os.scandir with string paths skips the per-entry Path
+    # construction and fnmatch of glob("*.json") — a Path is only built for
+    # the returned hit.
+    def _scan_leaf(job: tuple[Path, str]) -> Optional[tuple[Path, str]]:
+        subdir, provider = job
+        with os.scandir(subdir) as it:
+            for entry in it:
+                if not (entry.name.endswith(".json") and entry.is_file()):
+                    continue
+                try:
+                    peeked = _peek_top_level_uuid(entry.path)
+                    if peeked is not None:
+                        if peeked == uuid:
+                            return Path(entry.path), provider
+                        continue
+                    with open(entry.path, "rb") as f:
+                        data = _json_loads(f.read())
+                        if data.get("uuid") == uuid:
+                            return Path(entry.path), provider
+                except Exception:
+                    continue
+        return None
+
+    # Collect the leaf directories across claude/ and chatgpt/ accounts.
+    jobs = []
     for provider in ["claude", "chatgpt"]:
         provider_dir = data_dir / provider
         if not provider_dir.exists():
@@ -81,35 +162,36 @@ def find_conversation_file(data_dir: Path, uuid: str) -> Optional[tuple[Path, st
             if not user_dir.is_dir():
                 continue
 
-            # Check conversations
-            conversations_dir = user_dir / "conversations"
-            if conversations_dir.exists():
-                for conv_file in conversations_dir.glob("*.json"):
-                    try:
-                        with open(conv_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            if data.get("uuid") == uuid:
-                                return conv_file, provider
-                    except Exception:
-                        continue
-
-            # Check projects
-            projects_dir = user_dir / "projects"
-            if projects_dir.exists():
-                for proj_file in projects_dir.glob("*.json"):
-                    try:
-                        with open(proj_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            if data.get("uuid") == uuid:
-                                return proj_file, provider
-                    except Exception:
-                        continue
+            for subdir_name in ("conversations", "projects"):
+                subdir = user_dir / subdir_name
+                if subdir.exists():
+                    jobs.append((subdir, provider))
+
+    # The scan is I/O-bound — one bounded peek read per file, a full parse
+    # only for files without the peekable layout — so leaf directories scan
+    # in parallel to overlap disk latency on a cold page cache (same pool
+    # idiom as the sync script's item writes). map() yields results in
+    # submission order, so the claude-before-chatgpt priority holds no
+    # matter which worker finishes first.
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            for hit in executor.map(_scan_leaf, jobs):
+                if hit:
+                    return hit
+    elif jobs:
+        return _scan_leaf(jobs[0])
 
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_timestamp(timestamp_str: str) -> str:
-    """Format an ISO timestamp as 'YYYY-MM-DD HH:MM' in local time."""
+    """Format an ISO timestamp as 'YYYY-MM-DD HH:MM' in local time.
+
+    Memoized: the fromisoformat/astimezone/strftime round trip runs once per
+    distinct timestamp, and long transcripts repeat timestamps (messages in
+    the same minute, doc/header reuse of created_at).
+    """
     try:
         dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
         return dt.astimezone().strftime('%Y-%m-%d %H:%M')
@@ -117,12 +199,16 @@ def format_timestamp(timestamp_str: str) -> str:
         return timestamp_str
 
 
+@functools.lru_cache(maxsize=4096)
 def time_tag(iso: str, cls: str) -> str:
     """An ISO timestamp as a <time> element.
 
     The raw ISO value is kept in the `datetime` attribute; a small script in
     the generated page reformats the visible text to the viewer's local time.
     The Python-formatted fallback shows if scripting is disabled.
+
+    Memoized like format_timestamp: repeated timestamps skip the two
+    html.escape calls and the tag assembly, not just the datetime round trip.
     """
     return (f'<time class="{cls}" datetime="{html.escape(iso or "")}">'
             f'{html.escape(format_timestamp(iso))}</time>')
@@ -662,8 +748,8 @@ def render_conversation(provider: str, conv_file: Path, fmt: str,
     if renderers is not None:
         md_fn, html_fn = renderers
         return html_fn(conv_file) if fmt == "html" else md_fn(conv_file)
-    with open(conv_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(conv_file, "rb") as f:
+        data = _json_loads(f.read())
     if item_type == "project":
         if fmt == "markdown":
             return project_to_markdown(data)
@@ -673,6 +759,23 @@ def render_conversation(provider: str, conv_file: Path, fmt: str,
     return conversation_to_html(data, provider)
 
 
+def _spawn_detached(cmd: list) -> None:
+    """Launch a command fully detached: own session, no inherited pipes.
+
+    For the browser openers (xdg-open / open) there is nothing to wait for —
+    blocking until they exit just keeps this process (and the rendered page
+    it holds in memory) alive. The editor launch stays blocking on purpose;
+    that one is interactive.
+    """
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
 def get_output_path(local_views_dir: Path, uuid: str, provider: str, format: str = "markdown") -> Path:
     """Get output path for the specified format, namespaced by provider."""
     extension = "md" if format == "markdown" else "html"
@@ -831,11 +934,14 @@ Examples:
             # Open HTML in browser
             print(f"Opening in browser...")
             try:
-                # Try xdg-open (Linux), open (macOS), or start (Windows)
+                # Try xdg-open (Linux), open (macOS), or start (Windows).
+                # Linux/macOS launch detached — there's nothing to wait for.
+                # Windows `start` detaches on its own and Popen's
+                # start_new_session is POSIX-only, so that branch stays put.
                 if sys.platform.startswith('linux'):
-                    subprocess.run(["xdg-open", str(output_path)])
+                    _spawn_detached(["xdg-open", str(output_path)])
                 elif sys.platform == 'darwin':
-                    subprocess.run(["open", str(output_path)])
+                    _spawn_detached(["open", str(output_path)])
                 elif sys.platform == 'win32':
                     subprocess.run(["start", str(output_path)], shell=True)
                 else: